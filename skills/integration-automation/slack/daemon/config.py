@@ -6,6 +6,20 @@ All settings can be overridden via environment variables prefixed with SLACK_DAE
 
 import os
 
+
+def _env_int(name: str, default: int) -> int:
+    return int(os.environ.get(name, default))
+
+
+def _env_float(name: str, default: float) -> float:
+    return float(os.environ.get(name, default))
+
+
+def _env_bool(name: str, default: bool) -> bool:
+    value = os.environ.get(name)
+    return default if value is None else value.lower() == "true"
+
+
 # Channel filtering
 ALLOWED_CHANNELS = None  # None = all channels bot is in
 BLOCKED_CHANNELS: set = set()  # Channel IDs to never respond in
@@ -14,7 +28,7 @@ BLOCKED_CHANNELS: set = set()  # Channel IDs to never respond in
 MAX_RESPONSE_LENGTH = 3000  # Slack message limit ~4000 chars; leave headroom
 
 # Claude Code invocation
-CLAUDE_TIMEOUT = int(os.environ.get("SLACK_DAEMON_TIMEOUT", "120"))
+CLAUDE_TIMEOUT = _env_int("SLACK_DAEMON_TIMEOUT", 120)
 CLAUDE_CWD = os.path.expanduser(
     os.environ.get("SLACK_DAEMON_CWD", "~/Desktop/Programming")
 )
@@ -23,30 +37,28 @@ CLAUDE_ALLOWED_TOOLS = os.environ.get(
 )
 
 # Session expiry
-SESSION_TTL_HOURS = int(os.environ.get("SLACK_DAEMON_SESSION_TTL", "24"))
+SESSION_TTL_HOURS = _env_int("SLACK_DAEMON_SESSION_TTL", 24)
 
 # Soul engine
-SOUL_ENGINE_ENABLED = os.environ.get("SLACK_DAEMON_SOUL_ENGINE", "true").lower() == "true"
-WORKING_MEMORY_WINDOW = int(os.environ.get("SLACK_DAEMON_MEMORY_WINDOW", "20"))
-USER_MODEL_UPDATE_INTERVAL = int(os.environ.get("SLACK_DAEMON_USER_MODEL_INTERVAL", "5"))
-WORKING_MEMORY_TTL_HOURS = int(os.environ.get("SLACK_DAEMON_MEMORY_TTL", "72"))
-SOUL_STATE_UPDATE_INTERVAL = int(os.environ.get("SLACK_DAEMON_SOUL_STATE_INTERVAL", "3"))
+SOUL_ENGINE_ENABLED = _env_bool("SLACK_DAEMON_SOUL_ENGINE", True)
+WORKING_MEMORY_WINDOW = _env_int("SLACK_DAEMON_MEMORY_WINDOW", 20)
+USER_MODEL_UPDATE_INTERVAL = _env_int("SLACK_DAEMON_USER_MODEL_INTERVAL", 5)
+WORKING_MEMORY_TTL_HOURS = _env_int("SLACK_DAEMON_MEMORY_TTL", 72)
+SOUL_STATE_UPDATE_INTERVAL = _env_int("SLACK_DAEMON_SOUL_STATE_INTERVAL", 3)
 
 # Terminal session (unified launcher)
 TERMINAL_SESSION_TOOLS = os.environ.get(
     "SLACK_DAEMON_TERMINAL_TOOLS",
     "Read,Glob,Grep,Bash,WebFetch,Edit,Write",
 )
-TERMINAL_SOUL_ENABLED = os.environ.get(
-    "SLACK_DAEMON_TERMINAL_SOUL", "false"
-).lower() == "true"
+TERMINAL_SOUL_ENABLED = _env_bool("SLACK_DAEMON_TERMINAL_SOUL", False)
 
 # Streaming
-STREAMING_ENABLED = os.environ.get("SLACK_DAEMON_STREAMING", "false").lower() == "true"
-STREAMING_CHUNK_DELAY = float(os.environ.get("SLACK_DAEMON_STREAM_DELAY", "0.05"))
+STREAMING_ENABLED = _env_bool("SLACK_DAEMON_STREAMING", False)
+STREAMING_CHUNK_DELAY = _env_float("SLACK_DAEMON_STREAM_DELAY", 0.05)
 
 # AI Block Kit
-AI_BLOCKS_ENABLED = os.environ.get("SLACK_DAEMON_AI_BLOCKS", "false").lower() == "true"
+AI_BLOCKS_ENABLED = _env_bool("SLACK_DAEMON_AI_BLOCKS", False)
 
 # Logging
 LOG_DIR = os.path.join(os.path.dirname(__file__), "logs")
@@ -6,22 +6,39 @@ All slack_*.py scripts import from this module.
 Requires: SLACK_BOT_TOKEN environment variable (xoxb-*)
 Optional: SLACK_USER_TOKEN environment variable (xoxp-*) for workspace-wide search
 Install: pip install requests
+Optional: pip install orjson for faster response parsing
 """
 
 import os
 import sys
 import json
+import threading
 import time
 import requests
+from requests.adapters import HTTPAdapter
 from datetime import datetime, timezone
 from typing import Any, Dict, List, Optional
 
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    _json_loads = json.loads  # stdlib also accepts the raw UTF-8 bytes
+
 SLACK_BOT_TOKEN = os.environ.get("SLACK_BOT_TOKEN")
 SLACK_USER_TOKEN = os.environ.get("SLACK_USER_TOKEN")
 BASE_URL = "https://slack.com/api"
 
 _USER_TOKEN_METHODS = {"search.messages", "search.files"}
 
+# Shared keep-alive session: one TLS handshake per host instead of one per call.
+# Retries stay in slack_api (429 + Retry-After), not in urllib3.
+SESSION = requests.Session()
+SESSION.mount("https://", HTTPAdapter(pool_connections=2, pool_maxsize=10, max_retries=0))
+if SLACK_BOT_TOKEN:
+    SESSION.headers["Authorization"] = f"Bearer {SLACK_BOT_TOKEN}"
+
+_JSON_HEADERS = {"Content-Type": "application/json; charset=utf-8"}
+
 
 def _get_token(method: str, token_override: str = None) -> str:
     if token_override:
@@ -63,8 +80,14 @@ RATE_LIMITS = {
     "chat.stopStream":              {"calls": 50, "period": 60},   # Tier 3
 }
 
-# Track last call time per method for local rate limiting
-_last_call: Dict[str, float] = {}
+# Next permitted call time per method for local rate limiting. Slots are
+# reserved under the lock so concurrent callers queue behind each other.
+_next_call: Dict[str, float] = {}
+_rate_lock = threading.Lock()
+
+# Headers of the most recent HTTP 200 response per method, so callers can
+# inspect rate-limit headers without making another request
+_last_headers: Dict[str, Any] = {}
 
 
 class SlackError(Exception):
@@ -76,32 +99,28 @@ class SlackError(Exception):
         super().__init__(f"{method}: {error}" + (f" — {detail}" if detail else ""))
 
 
-def _headers(token: str = None) -> Dict[str, str]:
-    t = token or SLACK_BOT_TOKEN
-    if not t:
-        print("Error: SLACK_BOT_TOKEN not set.", file=sys.stderr)
-        print("Get a Bot token at https://api.slack.com/apps", file=sys.stderr)
-        sys.exit(1)
-    return {
-        "Authorization": f"Bearer {t}",
-        "Content-Type": "application/json; charset=utf-8",
-    }
+def _auth_headers(token: str) -> Optional[Dict[str, str]]:
+    """Authorization override, or None when the session's bot token applies."""
+    if token == SLACK_BOT_TOKEN:
+        return None
+    return {"Authorization": f"Bearer {token}"}
 
 
 def _enforce_rate_limit(method: str):
-    """Sleep if needed to respect per-method rate limits."""
+    """Sleep if needed to respect per-method rate limits. Thread-safe."""
     limit = RATE_LIMITS.get(method)
     if not limit:
         return
     min_interval = limit["period"] / limit["calls"]
-    last = _last_call.get(method, 0)
-    elapsed = time.time() - last
-    if elapsed < min_interval:
-        wait = min_interval - elapsed
+    with _rate_lock:
+        now = time.monotonic()
+        slot = max(now, _next_call.get(method, now))
+        _next_call[method] = slot + min_interval
+    wait = slot - now
+    if wait > 0:
         if wait > 5:
             print(f"  [rate limit] Waiting {wait:.0f}s for {method}...", file=sys.stderr)
         time.sleep(wait)
-    _last_call[method] = time.time()
 
 
 # Methods that require form-encoded data instead of JSON
@@ -144,25 +163,26 @@ def slack_api(method: str, retries: int = 2, token: str = None, **params) -> Dic
         SlackError: If Slack returns ok=false
     """
     _enforce_rate_limit(method)
-    auth_token = _get_token(method, token)
+    auth = _auth_headers(_get_token(method, token))
+    json_headers = _JSON_HEADERS if auth is None else {**_JSON_HEADERS, **auth}
 
     for attempt in range(retries + 1):
         if method in _GET_METHODS:
-            resp = requests.get(
+            resp = SESSION.get(
                 f"{BASE_URL}/{method}",
-                headers={"Authorization": f"Bearer {auth_token}"},
+                headers=auth,
                 params=params,
             )
         elif method in _FORM_ENCODED_METHODS:
-            resp = requests.post(
+            resp = SESSION.post(
                 f"{BASE_URL}/{method}",
-                headers={"Authorization": f"Bearer {auth_token}"},
+                headers=auth,
                 data=params,
             )
         else:
-            resp = requests.post(
+            resp = SESSION.post(
                 f"{BASE_URL}/{method}",
-                headers=_headers(auth_token),
+                headers=json_headers,
                 json=params,
             )
 
@@ -176,7 +196,8 @@ def slack_api(method: str, retries: int = 2, token: str = None, **params) -> Dic
                 raise SlackError(method, "rate_limited", f"Retry-After: {retry_after}s")
 
         resp.raise_for_status()
-        data = resp.json()
+        _last_headers[method] = resp.headers
+        data = _json_loads(resp.content)
 
         if not data.get("ok"):
             raise SlackError(method, data.get("error", "unknown"), data.get("detail", ""))
@@ -186,6 +207,11 @@ def slack_api(method: str, retries: int = 2, token: str = None, **params) -> Dic
     raise SlackError(method, "max_retries", "Exhausted retries")
 
 
+def last_response_headers(method: str) -> Optional[Any]:
+    """Headers from the last successful HTTP response for method, if any."""
+    return _last_headers.get(method)
+
+
 def paginate(method: str, result_key: str, limit: int = 200, max_pages: int = 5, **params) -> List[Dict]:
     """
     Cursor-based pagination for Slack list endpoints.
@@ -28,27 +28,56 @@ LOG_DIR = os.path.join(DAEMON_DIR, "logs")
 
 
 # ---------------------------------------------------------------------------
-# XML extraction (standalone from soul_engine.py:386-402)
+# XML extraction
 # ---------------------------------------------------------------------------
-
-def _extract_tag(text, tag):
-    """Extract content and optional verb attribute from an XML tag.
-
-    Handles both verb="..." and other attributes (e.g. question="...").
+# Each tag is searched on its own, like soul_engine._extract_tag, so an
+# unclosed or nested tag can't swallow the tags after it. Unlike the daemon,
+# question= (mental_query) and unknown attributes are accepted too.
+
+_STRIP_TAGS = re.compile(r"<[^>]+>")
+
+# Every tag the cognitive step pipeline reads (mental_query is legacy).
+# A tag not listed here is never extracted.
+_COGNITIVE_TAGS = (
+    "internal_monologue",
+    "external_dialogue",
+    "reaction_check",
+    "reaction_emoji",
+    "user_model_check",
+    "user_model_update",
+    "soul_state_check",
+    "soul_state_update",
+    "mental_query",
+)
+
+# The attribute branches are disjoint (the catch-all refuses verb=/question=)
+# so a tag that fails to close can't backtrack through every split.
+_ATTRS = r'(?:\s+(?:(?:verb|question)="(?P<attr>[^"]*)"|(?!(?:verb|question)=)\w+="[^"]*"))*'
+
+_TAG_PATTERNS = {
+    tag: re.compile(rf"<{tag}{_ATTRS}\s*>(?P<body>.*?)</{tag}>", re.DOTALL)
+    for tag in _COGNITIVE_TAGS
+}
+
+
+def _extract_tags(text):
+    """Extract every cognitive tag present in the response.
+
+    Returns {tag: (content, attr)} where attr is the verb (monologue/dialogue)
+    or question (mental_query) attribute, if present; any other attributes
+    are accepted and ignored. The first occurrence of each tag wins.
     """
-    pattern = rf'<{tag}(?:\s+\w+="([^"]*)")*\s*>(.*?)</{tag}>'
-    match = re.search(pattern, text, re.DOTALL)
-    if match:
-        # Last captured attribute value (verb for monologue/dialogue, question for mental_query)
-        attr = match.group(1) if match.group(1) else None
-        content = match.group(2).strip()
-        return content, attr
-    return "", None
+    found = {}
+    for tag, pattern in _TAG_PATTERNS.items():
+        match = pattern.search(text)
+        if match:
+            found[tag] = (match["body"].strip(), match["attr"] or None)
+    return found
 
 
 def _strip_all_tags(text):
     """Remove all XML tags from text, keeping only content."""
-    return re.sub(r"<[^>]+>", "", text)
+    return _STRIP_TAGS.sub("", text)
 
 
 # ---------------------------------------------------------------------------
@@ -169,41 +198,38 @@ def cmd_extract(args):
         return
 
     ts = time.strftime("%Y-%m-%d %H:%M:%S")
+    tags = _extract_tags(raw)
+    missing = ("", None)
 
     # 1. Extract internalMonologue (for logging)
-    monologue, mono_verb = _extract_tag(raw, "internal_monologue")
-    if monologue and args.log:
-        os.makedirs(LOG_DIR, exist_ok=True)
-        log_path = os.path.join(LOG_DIR, "monologue.log")
-        with open(log_path, "a") as f:
-            f.write(f"[{ts}] {mono_verb or 'thought'}: {monologue}\n")
+    monologue, mono_verb = tags.get("internal_monologue", missing)
 
     # 2. Extract externalDialog
-    dialogue, dialogue_verb = _extract_tag(raw, "external_dialogue")
+    dialogue, dialogue_verb = tags.get("external_dialogue", missing)
 
     # 3. Extract reaction_check
-    reaction_check_raw, _ = _extract_tag(raw, "reaction_check")
+    reaction_check_raw, _ = tags.get("reaction_check", missing)
     reaction_check = reaction_check_raw.strip().lower() == "true" if reaction_check_raw else False
 
     # 4. Extract reaction_emoji (only meaningful if check was true)
-    reaction_emoji_raw, _ = _extract_tag(raw, "reaction_emoji")
+    reaction_emoji_raw, _ = tags.get("reaction_emoji", missing)
     reaction_emoji = reaction_emoji_raw.strip().replace(":", "") if reaction_check and reaction_emoji_raw else ""
 
     # 5. Extract user_model_check
-    model_check_raw, _ = _extract_tag(raw, "user_model_check")
+    model_check_raw, _ = tags.get("user_model_check", missing)
     user_model_check = model_check_raw.strip().lower() == "true" if model_check_raw else False
 
     # 6. Extract user_model_update (only meaningful if check was true)
-    user_model_update, _ = _extract_tag(raw, "user_model_update")
+    user_model_update, _ = tags.get("user_model_update", missing)
     if not user_model_check:
         user_model_update = ""
 
     # 7. Extract soul_state_check
-    state_check_raw, _ = _extract_tag(raw, "soul_state_check")
+    state_check_raw, _ = tags.get("soul_state_check", missing)
     soul_state_check = state_check_raw.strip().lower() == "true" if state_check_raw else False
 
     # 8. Extract soul_state_update
-    soul_state_update_raw, _ = _extract_tag(raw, "soul_state_update")
+    soul_state_update_raw, _ = tags.get("soul_state_update", missing)
     soul_state_updates = {}
     if soul_state_check and soul_state_update_raw:
         for line in soul_state_update_raw.strip().splitlines():
@@ -216,32 +242,33 @@ def cmd_extract(args):
             if key and value:
                 soul_state_updates[key] = value
 
-    # Log memory decisions
+    # Legacy: mentalQuery (backward compat with old responses)
+    query_content, _ = tags.get("mental_query", missing)
+
+    # Log monologue and memory decisions with a single append
     if args.log:
-        os.makedirs(LOG_DIR, exist_ok=True)
-        log_path = os.path.join(LOG_DIR, "monologue.log")
-        with open(log_path, "a") as f:
-            if model_check_raw:
-                f.write(f"[{ts}] user_model_check: {user_model_check}\n")
-            if user_model_check and user_model_update:
-                f.write(f"[{ts}] user_model_update: {user_model_update[:100]}...\n")
-            if state_check_raw:
-                f.write(f"[{ts}] soul_state_check: {soul_state_check}\n")
-            if soul_state_updates:
-                f.write(f"[{ts}] soul_state_update: {soul_state_updates}\n")
-            if reaction_check_raw:
-                f.write(f"[{ts}] reaction_check: {reaction_check}\n")
-            if reaction_check and reaction_emoji:
-                f.write(f"[{ts}] reaction_emoji: {reaction_emoji}\n")
-
-    # Legacy: also log mentalQuery if present (backward compat with old responses)
-    query_content, _ = _extract_tag(raw, "mental_query")
-    if query_content and args.log:
-        os.makedirs(LOG_DIR, exist_ok=True)
-        log_path = os.path.join(LOG_DIR, "monologue.log")
-        learned = query_content.strip().lower() == "true"
-        with open(log_path, "a") as f:
-            f.write(f"[{ts}] mentalQuery: learned_about_user={learned}\n")
+        entries = []
+        if monologue:
+            entries.append(f"[{ts}] {mono_verb or 'thought'}: {monologue}\n")
+        if model_check_raw:
+            entries.append(f"[{ts}] user_model_check: {user_model_check}\n")
+        if user_model_check and user_model_update:
+            entries.append(f"[{ts}] user_model_update: {user_model_update[:100]}...\n")
+        if state_check_raw:
+            entries.append(f"[{ts}] soul_state_check: {soul_state_check}\n")
+        if soul_state_updates:
+            entries.append(f"[{ts}] soul_state_update: {soul_state_updates}\n")
+        if reaction_check_raw:
+            entries.append(f"[{ts}] reaction_check: {reaction_check}\n")
+        if reaction_check and reaction_emoji:
+            entries.append(f"[{ts}] reaction_emoji: {reaction_emoji}\n")
+        if query_content:
+            learned = query_content.strip().lower() == "true"
+            entries.append(f"[{ts}] mentalQuery: learned_about_user={learned}\n")
+        if entries:
+            os.makedirs(LOG_DIR, exist_ok=True)
+            with open(os.path.join(LOG_DIR, "monologue.log"), "a") as f:
+                f.writelines(entries)
 
     # JSON output mode — structured data for SKILL.md to parse
     if args.json:
@@ -268,8 +295,8 @@ def cmd_extract(args):
         else:
             print(dialogue)
     else:
-        # Fallback: strip XML tags, return raw text
-        fallback = _strip_all_tags(raw).strip()
+        # Fallback: drop the private monologue, strip XML tags, return raw text
+        fallback = _strip_all_tags(_TAG_PATTERNS["internal_monologue"].sub("", raw)).strip()
         if fallback:
             print(fallback)
 
@@ -13,13 +13,18 @@ Requires: SLACK_BOT_TOKEN environment variable
 """
 
 import argparse
+import io
 import json
 import os
 import sys
+import tempfile
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 
 sys.path.insert(0, os.path.dirname(__file__))
-from _slack_utils import slack_api, resolve_channel, paginate, SlackError, SLACK_BOT_TOKEN
+from _slack_utils import (slack_api, resolve_channel, paginate, last_response_headers,
+                          SlackError, SLACK_BOT_TOKEN, SESSION)
 
 PASS = "\033[32mPASS\033[0m"
 FAIL = "\033[31mFAIL\033[0m"
@@ -27,11 +32,8 @@ SKIP = "\033[33mSKIP\033[0m"
 
 
 def test_auth(verbose: bool = False) -> bool:
-    """Validate bot token is set and valid."""
+    """Validate the bot token (main() has already checked it is set)."""
     print(f"  auth: ", end="")
-    if not SLACK_BOT_TOKEN:
-        print(f"{FAIL} — SLACK_BOT_TOKEN not set")
-        return False
     try:
         data = slack_api("auth.test")
         if verbose:
@@ -75,23 +77,33 @@ def test_users(verbose: bool = False) -> bool:
         return False
 
 
-def test_post(test_channel: str, verbose: bool = False) -> bool:
+def _delete_temp_message(channel_id: str, ts: str):
+    """Delete a test message, retrying once if Slack hasn't caught up yet."""
+    for attempt in range(2):
+        try:
+            slack_api("chat.delete", channel=channel_id, ts=ts)
+            return
+        except SlackError as e:
+            if e.error != "message_not_found" or attempt:
+                raise
+            time.sleep(0.1)
+
+
+def test_post(channel_id: str, verbose: bool = False) -> bool:
     """Post and delete a test message (verifies chat:write scope)."""
     print(f"  chat.postMessage: ", end="")
     try:
-        channel_id = resolve_channel(test_channel)
         data = slack_api("chat.postMessage", channel=channel_id,
                         text="[test] Slack skill validation — this message will be deleted")
         ts = data.get("ts", "")
         if verbose:
-            print(f"{PASS} — posted to {test_channel} [ts: {ts}]")
+            print(f"{PASS} — posted to {channel_id} [ts: {ts}]")
         else:
             print(PASS)
 
         # Clean up
-        time.sleep(1)
         print(f"  chat.delete: ", end="")
-        slack_api("chat.delete", channel=channel_id, ts=ts)
+        _delete_temp_message(channel_id, ts)
         print(PASS)
         return True
     except SlackError as e:
@@ -99,11 +111,10 @@ def test_post(test_channel: str, verbose: bool = False) -> bool:
         return False
 
 
-def test_read(test_channel: str, verbose: bool = False) -> bool:
+def test_read(channel_id: str, verbose: bool = False) -> bool:
     """Read channel history (verifies channels:history scope)."""
     print(f"  conversations.history: ", end="")
     try:
-        channel_id = resolve_channel(test_channel)
         data = slack_api("conversations.history", channel=channel_id, limit=5)
         messages = data.get("messages", [])
         if verbose:
@@ -135,12 +146,10 @@ def test_search(verbose: bool = False) -> bool:
         return False
 
 
-def test_reactions(test_channel: str, verbose: bool = False) -> bool:
+def test_reactions(channel_id: str, verbose: bool = False) -> bool:
     """Add and remove a reaction (verifies reactions:write scope)."""
     print(f"  reactions.add: ", end="")
     try:
-        channel_id = resolve_channel(test_channel)
-
         # Post a temp message to react to
         msg = slack_api("chat.postMessage", channel=channel_id,
                        text="[test] reaction test — will be deleted")
@@ -156,50 +165,42 @@ def test_reactions(test_channel: str, verbose: bool = False) -> bool:
         print(PASS)
 
         # Clean up
-        time.sleep(1)
-        slack_api("chat.delete", channel=channel_id, ts=ts)
+        _delete_temp_message(channel_id, ts)
         return True
     except SlackError as e:
         print(f"{FAIL} — {e}")
         return False
 
 
-def test_upload(test_channel: str, verbose: bool = False) -> bool:
+def test_upload(channel_id: str, verbose: bool = False) -> bool:
     """Test file upload via 2-step external API."""
     print(f"  files.upload (2-step): ", end="")
     try:
-        import tempfile
-        channel_id = resolve_channel(test_channel)
+        # Create a temp file; upload from the same handle (deleted on close)
+        with tempfile.NamedTemporaryFile(mode="w+b", suffix=".txt", prefix="slack_test_") as f:
+            f.write("Slack skill test file — will be deleted".encode())
+            length = f.tell()
+            f.seek(0)
 
-        # Create a temp file
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".txt", delete=False, prefix="slack_test_") as f:
-            f.write("Slack skill test file — will be deleted")
-            tmppath = f.name
-
-        try:
             # Step 1: Get upload URL
             url_resp = slack_api("files.getUploadURLExternal",
-                                 filename="test.txt", length=os.path.getsize(tmppath))
+                                 filename="test.txt", length=length)
             upload_url = url_resp["upload_url"]
             file_id = url_resp["file_id"]
 
             # Step 2: POST file (multipart form per official docs)
-            import requests as req
-            with open(tmppath, "rb") as f:
-                post_resp = req.post(upload_url, files={"file": ("test.txt", f)})
-                post_resp.raise_for_status()
-
-            # Step 3: Complete upload (private — no channel)
-            slack_api("files.completeUploadExternal",
-                      files=[{"id": file_id, "title": "test.txt"}])
-
-            if verbose:
-                print(f"{PASS} — uploaded file_id={file_id}")
-            else:
-                print(PASS)
-            return True
-        finally:
-            os.unlink(tmppath)
+            post_resp = SESSION.post(upload_url, files={"file": ("test.txt", f)})
+            post_resp.raise_for_status()
+
+        # Step 3: Complete upload (private — no channel)
+        slack_api("files.completeUploadExternal",
+                  files=[{"id": file_id, "title": "test.txt"}])
+
+        if verbose:
+            print(f"{PASS} — uploaded file_id={file_id}")
+        else:
+            print(PASS)
+        return True
 
     except SlackError as e:
         print(f"{FAIL} — {e}")
@@ -210,24 +211,76 @@ def test_upload(test_channel: str, verbose: bool = False) -> bool:
 
 
 def test_rate_limit_headers(verbose: bool = False) -> bool:
-    """Verify rate limit headers are returned."""
+    """Verify rate limit headers are returned (reuses test_auth's response)."""
     print(f"  rate-limit headers: ", end="")
+    headers = last_response_headers("auth.test")
+    if headers is None:
+        print(f"{SKIP} — no auth.test response to inspect")
+    elif any(k.lower().startswith("x-ratelimit") for k in headers):
+        print(PASS)
+    else:
+        print(f"{SKIP} — no rate limit headers (may vary by endpoint)")
+    return True
+
+
+class _ThreadBufferedStdout:
+    """sys.stdout stand-in that buffers writes from capturing worker threads.
+
+    Lets concurrent tests keep using print(..., end="") without their
+    partial lines interleaving on the terminal.
+    """
+
+    def __init__(self, real):
+        self._real = real
+        self._local = threading.local()
+
+    def capture(self):
+        self._local.buf = io.StringIO()
+
+    def release(self) -> str:
+        text = self._local.buf.getvalue()
+        self._local.buf = None
+        return text
+
+    def write(self, s):
+        buf = getattr(self._local, "buf", None)
+        return (buf or self._real).write(s)
+
+    def flush(self):
+        self._real.flush()
+
+
+def run_tests(plan, verbose: bool = False, workers: int = 6) -> list:
+    """Run (fn, *args) tests concurrently; print their output in plan order.
+
+    Ordering only matters inside a test (post→delete, react→remove), and
+    each test runs its own steps serially, so tests are independent.
+    """
+    out = _ThreadBufferedStdout(sys.stdout)
+
+    def run_one(fn, *a):
+        # Transport errors (HTTPError, ConnectionError) count as this test's
+        # failure rather than aborting the report for every other test
+        out.capture()
+        try:
+            ok = fn(*a, verbose=verbose)
+        except Exception as e:
+            return False, out.release() + f"{FAIL} — {e}\n"
+        return ok, out.release()
+
+    sys.stdout = out
     try:
-        import requests as req
-        headers = {
-            "Authorization": f"Bearer {SLACK_BOT_TOKEN}",
-            "Content-Type": "application/json; charset=utf-8",
-        }
-        resp = req.post(f"https://slack.com/api/auth.test", headers=headers, json={})
-        has_headers = any(k.lower().startswith("x-ratelimit") for k in resp.headers)
-        if has_headers or resp.status_code == 200:
-            print(PASS)
-        else:
-            print(f"{SKIP} — no rate limit headers (may vary by endpoint)")
-        return True
-    except Exception as e:
-        print(f"{FAIL} — {e}")
-        return False
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            futures = [pool.submit(run_one, *test) for test in plan]
+            results = []
+            for fut in futures:
+                ok, text = fut.result()
+                out.write(text)
+                out.flush()
+                results.append(ok)
+    finally:
+        sys.stdout = out._real
+    return results
 
 
 def main():
@@ -240,46 +293,62 @@ def main():
     parser.add_argument("--verbose", "-v", action="store_true", help="Detailed output")
     args = parser.parse_args()
 
+    # Fail fast: every test below needs a token, and resolve_channel would
+    # otherwise exit from inside _slack_utils before any results print
+    if not SLACK_BOT_TOKEN:
+        print("Error: SLACK_BOT_TOKEN not set", file=sys.stderr)
+        sys.exit(1)
+
     print("Slack Skill Test Suite")
     print("=" * 40)
 
-    passed = 0
-    failed = 0
+    # Auth runs on its own first: it gates everything, and
+    # test_rate_limit_headers inspects its response headers
+    results = run_tests([(test_auth,)], verbose=args.verbose)
 
-    def run(fn, *a):
-        nonlocal passed, failed
-        if fn(*a, verbose=args.verbose):
-            passed += 1
-        else:
+    # Resolve the write-test channel once instead of inside every test
+    failed = 0
+    channel_id = None
+    if not args.quick and args.test in (None, "post", "read", "react", "upload"):
+        try:
+            channel_id = resolve_channel(args.test_channel)
+        except Exception as e:  # SlackError or a transport error, as in run_tests
+            print(f"  resolve_channel: {FAIL} — {e}")
             failed += 1
 
     if args.test:
-        run(test_auth)
         tests = {
-            "post": lambda: run(test_post, args.test_channel),
-            "read": lambda: run(test_read, args.test_channel),
-            "search": lambda: run(test_search),
-            "react": lambda: run(test_reactions, args.test_channel),
-            "users": lambda: run(test_users),
-            "channels": lambda: run(test_channels),
-            "upload": lambda: run(test_upload, args.test_channel),
+            "post": (test_post, channel_id),
+            "read": (test_read, channel_id),
+            "search": (test_search,),
+            "react": (test_reactions, channel_id),
+            "users": (test_users,),
+            "channels": (test_channels,),
+            "upload": (test_upload, channel_id),
         }
-        tests[args.test]()
+        plan = [tests[args.test]]
 
     elif args.quick:
-        run(test_auth)
-        run(test_channels)
+        plan = [(test_channels,)]
 
     else:
-        run(test_auth)
-        run(test_channels)
-        run(test_users)
-        run(test_post, args.test_channel)
-        run(test_read, args.test_channel)
-        run(test_search)
-        run(test_reactions, args.test_channel)
-        run(test_upload, args.test_channel)
-        run(test_rate_limit_headers)
+        plan = [
+            (test_channels,),
+            (test_users,),
+            (test_post, channel_id),
+            (test_read, channel_id),
+            (test_search,),
+            (test_reactions, channel_id),
+            (test_upload, channel_id),
+            (test_rate_limit_headers,),
+        ]
+
+    # Channel tests can't run if the channel didn't resolve
+    plan = [test for test in plan if None not in test[1:]]
+
+    results += run_tests(plan, verbose=args.verbose)
+    passed = sum(results)
+    failed += len(results) - passed
 
     print(f"\n{'=' * 40}")
     print(f"Results: {passed} passed, {failed} failed")
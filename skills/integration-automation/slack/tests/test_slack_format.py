@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+"""Tests for scripts/slack_format.py tag extraction.
+
+Run: python3 -m pytest skills/integration-automation/slack/tests/test_slack_format.py -v
+
+Pure string tests — no Slack API calls, no daemon imports.
+"""
+import importlib.util
+import pathlib
+import time
+
+import pytest
+
+SCRIPTS_DIR = pathlib.Path(__file__).resolve().parent.parent / "scripts"
+
+
+# ---------------------------------------------------------------------------
+# Module loading helpers
+# ---------------------------------------------------------------------------
+
+def _load_module(name, path):
+    """Import a script as a module."""
+    spec = importlib.util.spec_from_file_location(name, str(path))
+    mod = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(mod)
+    return mod
+
+
+@pytest.fixture
+def slack_format():
+    return _load_module("slack_format", SCRIPTS_DIR / "slack_format.py")
+
+
+# ---------------------------------------------------------------------------
+# _extract_tags — unit tests
+# ---------------------------------------------------------------------------
+
+class TestExtractTags:
+    """Test _extract_tags() attribute handling."""
+
+    def test_verb_attribute(self, slack_format):
+        tags = slack_format._extract_tags(
+            '<external_dialogue verb="said">Hello</external_dialogue>')
+        assert tags["external_dialogue"] == ("Hello", "said")
+
+    def test_question_attribute(self, slack_format):
+        tags = slack_format._extract_tags(
+            '<mental_query question="new?">true</mental_query>')
+        assert tags["mental_query"] == ("true", "new?")
+
+    def test_extra_attributes_ignored(self, slack_format):
+        tags = slack_format._extract_tags(
+            '<internal_monologue id="1" verb="mused" mood="x">hm</internal_monologue>')
+        assert tags["internal_monologue"] == ("hm", "mused")
+
+    def test_unclosed_tag_does_not_swallow_later_tags(self, slack_format):
+        tags = slack_format._extract_tags(
+            '<internal_monologue verb="mused">secret</internal_monologue>\n'
+            '<reaction_check>false\n'
+            '<external_dialogue verb="said">Hello</external_dialogue>\n'
+            '<reaction_check>false</reaction_check>')
+        assert tags["internal_monologue"] == ("secret", "mused")
+        assert tags["external_dialogue"] == ("Hello", "said")
+
+    def test_nested_tag_extracted(self, slack_format):
+        tags = slack_format._extract_tags(
+            '<internal_monologue>x <reaction_check>true</reaction_check>'
+            '</internal_monologue>')
+        assert tags["reaction_check"] == ("true", None)
+
+    def test_repeated_attributes_fail_fast(self, slack_format):
+        # An unterminated tag with many verb attributes must not backtrack
+        # exponentially (an overlapping attribute alternation took seconds
+        # at ~20 repeats)
+        text = '<external_dialogue' + ' verb="a"' * 2000 + ' x'
+        start = time.perf_counter()
+        assert slack_format._extract_tags(text) == {}
+        assert time.perf_counter() - start < 0.5